@@ -1,7 +1,12 @@
-from dataclasses import dataclass
+import sys
+from functools import lru_cache
 from itertools import chain
-from typing import List, Tuple, Set
-import copy
+from typing import List, NamedTuple, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; syllabify_batch falls back to syllabify
+    np = None
 
 # Constants
 SLAX = {
@@ -18,6 +23,13 @@ VOWELS = {
     'UH', 'IH', 'EH', 'AE', 'AH',
 } | SLAX
 
+# Each vowel with its stress digit removed, interned so that destressed
+# nuclei share the canonical string objects
+DESTRESSED = {
+    vowel: sys.intern(vowel[:-1]) if vowel[-1] in '012' else vowel
+    for vowel in VOWELS
+}
+
 # Licit medial onsets
 O2 = {
     ('P', 'R'), ('T', 'R'), ('K', 'R'), ('B', 'R'), ('D', 'R'),
@@ -34,127 +46,173 @@ O3 = {
     ('S', 'T', 'R'), ('S', 'K', 'L'), ('T', 'R', 'W')  # "octroi"
 }
 
-@dataclass
-class Syllable:
-    onset: List[str]
-    nucleus: List[str]
-    coda: List[str]
+CONSONANTS = {
+    'B', 'CH', 'D', 'DH', 'F', 'G', 'HH', 'JH', 'K', 'L', 'M', 'N', 'NG',
+    'P', 'R', 'S', 'SH', 'T', 'TH', 'V', 'W', 'Y', 'Z', 'ZH',
+}
 
-def identify_nuclei_and_onsets(pronunciation: List[str]) -> Tuple[List[List[str]], List[List[str]], List[str]]:
+# Integer phoneme codes. Every code fits in a byte, so clusters pack into a
+# single int (8 bits per phoneme) and the vowel/lax tables are plain bytes
+# indexed by code. Symbols outside the inventory share UNKNOWN_ID and are
+# treated as consonants, as they were by the string-based rules.
+# The symbols are interned so that lookups with interned input (e.g. tokens
+# passed through sys.intern by a dictionary loader) match by identity.
+PHONEMES = tuple(sorted(map(sys.intern, VOWELS | CONSONANTS)))
+PHONEME_ID = {phoneme: code for code, phoneme in enumerate(PHONEMES)}
+UNKNOWN_ID = len(PHONEMES)
+S_ID = PHONEME_ID['S']
+
+IS_VOWEL = bytes([phoneme in VOWELS for phoneme in PHONEMES] + [False])
+IS_SLAX = bytes([phoneme in SLAX for phoneme in PHONEMES] + [False])
+# Lax-vowel table with every flag off; passing it instead of IS_SLAX turns
+# the Alaska rule off without a per-syllable test of the flag
+NO_SLAX = bytes(len(IS_SLAX))
+IS_VOWEL_ARRAY = np.frombuffer(IS_VOWEL, dtype=np.bool_) if np is not None else None
+
+O2_PACKED = frozenset(
+    (PHONEME_ID[a] << 8) | PHONEME_ID[b] for a, b in O2
+)
+O3_PACKED = frozenset(
+    (PHONEME_ID[a] << 16) | (PHONEME_ID[b] << 8) | PHONEME_ID[c] for a, b, c in O3
+)
+
+# Onset depth licensed by each trailing cluster. Consonant codes are nonzero,
+# so packed three-phoneme keys never collide with packed two-phoneme ones.
+ONSET_DEPTH = {**dict.fromkeys(O2_PACKED, 2), **dict.fromkeys(O3_PACKED, 3)}
+
+class Syllable(NamedTuple):
+    onset: Tuple[str, ...]
+    nucleus: Tuple[str, ...]
+    coda: Tuple[str, ...]
+
+def encode(pron: Sequence[str]) -> List[int]:
     """
-    Identify nuclei and onsets in the pronunciation.
+    Encode ARPABET phonemes as integer phoneme codes.
 
     Args:
-        pronunciation (List[str]): List of ARPABET phonemes.
+        pron (Sequence[str]): A sequence of ARPABET phonemes.
 
     Returns:
-        Tuple containing:
-            - nuclei (List[List[str]]): List of nuclei per syllable.
-            - onsets (List[List[str]]): List of onsets per syllable.
-            - codas (List[str]): Remaining phonemes after the last nucleus.
-    """
-    nuclei = []
-    onsets = []
-    last_vowel_index = -1
-
-    for index, segment in enumerate(pronunciation):
-        if segment in VOWELS:
-            nuclei.append([segment])
-            onsets.append(pronunciation[last_vowel_index + 1:index])
-            last_vowel_index = index
-
-    # Collect remaining segments as coda
-    codas = pronunciation[last_vowel_index + 1:]
-    return nuclei, onsets, codas
-
-def resolve_onsets_and_codas(
-    nuclei: List[List[str]],
-    onsets: List[List[str]],
-    codas: List[str],
-    alaska_rule: bool,
-    SLAX: Set[str],
-    O3: Set[Tuple[str, ...]],
-    O2: Set[Tuple[str, ...]]
-) -> Tuple[List[List[str]], List[List[str]]]:
-    """
-    Resolve onsets and compute codas based on syllabification rules.
-
-    This function adjusts the onsets of syllables to maximize onset clusters according to specified rules.
-    It also computes the codas for each syllable based on the adjusted onsets and remaining phonemes.
-    Optionally, it applies the Alaska rule to handle specific consonant clusters.
+        List[int]: The code of each phoneme, UNKNOWN_ID for unlisted symbols.
+
+    Example:
+        >>> [PHONEMES[code] for code in encode(['K', 'AE1', 'T'])]
+        ['K', 'AE1', 'T']
+    """
+    get_id = PHONEME_ID.get
+    return [get_id(phoneme, UNKNOWN_ID) for phoneme in pron]
+
+def _find_nuclei(codes: Sequence[int]) -> List[int]:
+    """Return the position of every vowel in `codes`."""
+    return [index for index, segment in enumerate(codes) if IS_VOWEL[segment]]
+
+def _syllabify(pronunciation: Sequence, codes: Sequence[int], nuclei: List[int], slax: bytes) -> List[Syllable]:
+    """
+    Syllabify `codes` around its nuclei, slicing syllables out of `pronunciation`.
+
+    For each pair of adjacent nuclei, the consonants between them are split
+    between the first nucleus's coda and the second's onset (Alaska rule,
+    then onset maximization), and the earlier syllable is emitted.
 
     Args:
-        nuclei (List[List[str]]): List of nuclei (vowels) per syllable.
-        onsets (List[List[str]]): List of onsets (consonant clusters) per syllable.
-        codas (List[str]): Remaining phonemes after the last nucleus to be assigned as codas.
-        alaska_rule (bool): Whether to apply the Alaska syllabification rule.
-        SLAX (Set[str]): Set of consonant clusters relevant to the Alaska rule.
-        O3 (Set[Tuple[str, ...]]): Set of three-consonant clusters for onset maximization.
-        O2 (Set[Tuple[str, ...]]): Set of two-consonant clusters for onset maximization.
+        pronunciation (Sequence): The sequence to slice syllables from; either
+            the ARPABET phonemes or `codes` itself.
+        codes (Sequence[int]): Phoneme codes of `pronunciation` (see `encode`).
+        nuclei (List[int]): Positions of the vowels in `codes`, in order.
+        slax (bytes): Lax-vowel flags for the Alaska rule; IS_SLAX to apply
+            the rule, NO_SLAX to skip it.
 
     Returns:
-        Tuple[List[List[str]], List[List[str]]]:
-            - Updated onsets per syllable after resolving.
-            - Updated codas per syllable after resolving.
+        List[Syllable]: Syllables holding slices of `pronunciation`.
 
     Raises:
-        ValueError: If input lists are empty or mismatched in length.
-
-    Example:
-        >>> nuclei = [['AH0'], ['AE1']]
-        >>> onsets = [['K'], ['S', 'T']]
-        >>> codas = ['D']
-        >>> resolve_onsets_and_codas(nuclei, onsets, codas, True, SLAX, O3, O2)
-        ([['K'], ['S', 'T']], [['D'], []])
+        ValueError: If the pronunciation contains no vowels.
     """
-    # Validate inputs
-    if not nuclei or not onsets:
-        raise ValueError("Nuclei and onsets lists must not be empty.")
-    if len(nuclei) != len(onsets):
-        raise ValueError("Nuclei and onsets lists must be of the same length.")
+    if not nuclei:
+        raise ValueError(f"Could not syllabify {list(pronunciation)}: no vowels found.")
 
-    # Create deep copies to avoid mutating original inputs
-    nuclei = copy.deepcopy(nuclei)
-    onsets = copy.deepcopy(onsets)
-    resolved_codas = [[] for _ in range(len(onsets))]
+    syllables = []
+    onset_start = 0
+    nucleus = nuclei[0]
 
-    for i in range(1, len(onsets)):
-        coda = []
-        current_onset = onsets[i]
-
-        # Removed the 'starts_with_R' handling to prevent treating 'R' as a vowel
+    for index in nuclei[1:]:
+        lo = nucleus + 1
 
         # Apply Alaska rule
         applies_alaska_rule = (
-            len(current_onset) > 1 and
-            alaska_rule and
-            nuclei[i - 1][-1] in SLAX and
-            current_onset[0] == 'S'
+            index - lo > 1 and
+            slax[codes[nucleus]] and
+            codes[lo] == S_ID
         )
         if applies_alaska_rule:
-            coda.append(current_onset.pop(0))
+            lo += 1
 
         # Onset maximization
         depth = 1
-        if len(current_onset) > 1:
-            last_two = tuple(current_onset[-2:])
-            last_three = tuple(current_onset[-3:]) if len(current_onset) >= 3 else ()
-            if last_three in O3:
-                depth = 3
-            elif last_two in O2:
-                depth = 2
+        if index - lo > 1:
+            last_two = (codes[index - 2] << 8) | codes[index - 1]
+            depth = ONSET_DEPTH.get(last_two, 1)
+            if index - lo >= 3:
+                depth = ONSET_DEPTH.get((codes[index - 3] << 16) | last_two, depth)
+
+        # Consonants the onset cannot keep close the previous syllable
+        if index - lo > depth:
+            lo = index - depth
+
+        syllables.append(Syllable(
+            pronunciation[onset_start:nucleus],
+            pronunciation[nucleus:nucleus + 1],
+            pronunciation[nucleus + 1:lo],
+        ))
+        onset_start = lo
+        nucleus = index
+
+    # Remaining segments form the last syllable's coda
+    syllables.append(Syllable(
+        pronunciation[onset_start:nucleus],
+        pronunciation[nucleus:nucleus + 1],
+        pronunciation[nucleus + 1:],
+    ))
+    return syllables
 
-        # Transfer phonemes from onset to coda based on depth
-        while len(current_onset) > depth:
-            coda.append(current_onset.pop(0))
+def syllabify_codes(codes: List[int], alaska_rule: bool = True) -> List[Syllable]:
+    """
+    Syllabifies a pronunciation that is already encoded as phoneme codes.
 
-        resolved_codas[i - 1] = coda
+    Args:
+        codes (List[int]): Phoneme codes as returned by `encode`.
+        alaska_rule (bool): Whether to apply the Alaska rule for syllabification.
+
+    Returns:
+        List[Syllable]: Syllables whose onsets, nuclei and codas hold phoneme codes.
+
+    Raises:
+        ValueError: If the pronunciation contains no vowels.
+    """
+    codes = tuple(codes)
+    return _syllabify(codes, codes, _find_nuclei(codes), IS_SLAX if alaska_rule else NO_SLAX)
+
+@lru_cache(maxsize=200_000)
+def _syllabify_cached(pronunciation: Tuple[str, ...], alaska_rule: bool) -> Tuple[Syllable, ...]:
+    """
+    Syllabify a pronunciation tuple, memoizing the result.
 
-    # Assign remaining codas to the last syllable's coda
-    if codas:
-        resolved_codas[-1].extend(codas)
+    Homographs and repeated words share pronunciations, so corpus runs hit
+    this cache often. Syllables hold tuples of phonemes and
+    are immutable, so they can be shared between callers.
+    """
+    # Resolve boundaries on the codes, then cut the original phonemes at them
+    codes = encode(pronunciation)
+    syllables = _syllabify(pronunciation, codes, _find_nuclei(codes), IS_SLAX if alaska_rule else NO_SLAX)
+
+    # Verify all segments are included (skipped under -O). Syllables are
+    # contiguous slices, so matching the total length is enough.
+    if __debug__:
+        if sum(map(len, chain.from_iterable(syllables))) != len(pronunciation):
+            flat_output = list(chain.from_iterable(chain.from_iterable(syllables)))
+            raise ValueError(f"Could not syllabify {list(pronunciation)}. Syllabified output: {flat_output}")
 
-    return onsets, resolved_codas
+    return tuple(syllables)
 
 def syllabify(pron: List[str], alaska_rule: bool = True) -> List[Syllable]:
     """
@@ -165,72 +223,162 @@ def syllabify(pron: List[str], alaska_rule: bool = True) -> List[Syllable]:
         alaska_rule (bool): Whether to apply the Alaska rule for syllabification.
 
     Returns:
-        List[Syllable]: A list of Syllable dataclasses representing the syllables.
+        List[Syllable]: A list of Syllable tuples representing the syllables.
 
     Raises:
-        ValueError: If syllabification does not include all phonemes.
+        ValueError: If the pronunciation has no vowels, or if syllabification
+            does not include all phonemes.
     
     Examples:
         >>> syllabify(['AH0', 'L', 'AE1', 'S', 'K', 'AH0'])
-        [Syllable(onset=[], nucleus=['AH0'], coda=[]), Syllable(onset=['L'], nucleus=['AE1'], coda=[]), Syllable(onset=['S', 'K'], nucleus=['AH0'], coda=[])]
+        [Syllable(onset=(), nucleus=('AH0',), coda=()), Syllable(onset=('L',), nucleus=('AE1',), coda=('S',)), Syllable(onset=('K',), nucleus=('AH0',), coda=())]
     """
-    pronunciation = list(pron)
-    nuclei, onsets, codas = identify_nuclei_and_onsets(pronunciation)
-    onsets, resolved_codas = resolve_onsets_and_codas(nuclei, onsets, codas, alaska_rule, SLAX, O3, O2)
+    return list(_syllabify_cached(tuple(pron), alaska_rule))
 
-    syllables = [
-        Syllable(onset, nucleus, coda)
-        for onset, nucleus, coda in zip(onsets, nuclei, resolved_codas)
-    ]
+def syllabify_view(pron: Tuple[str, ...], alaska_rule: bool = True) -> Tuple[Syllable, ...]:
+    """
+    Syllabifies a pronunciation tuple without copying the input or the result.
 
-    # Assign any remaining coda to the last syllable
-    if len(resolved_codas) > len(onsets):
-        syllables[-1].coda.extend(resolved_codas[-1])
+    The tuple is used as the cache key as-is, and the cached syllables are
+    returned directly; they are immutable and shared with other callers.
 
-    # Flatten syllables and verify all segments are included
-    flat_output = list(chain.from_iterable([s.onset + s.nucleus + s.coda for s in syllables]))
-    if flat_output != pronunciation:
-        raise ValueError(f"Could not syllabify {pronunciation}. Syllabified output: {flat_output}")
+    Args:
+        pron (Tuple[str, ...]): A tuple of ARPABET phonemes representing a word.
+        alaska_rule (bool): Whether to apply the Alaska rule for syllabification.
 
-    return syllables
+    Returns:
+        Tuple[Syllable, ...]: The syllables of the pronunciation.
+
+    Raises:
+        ValueError: If the pronunciation has no vowels, or if syllabification
+            does not include all phonemes.
+
+    Example:
+        >>> pretty_print(syllabify_view(('K', 'AE1', 'T')))
+        'K-AE1-T'
+    """
+    return _syllabify_cached(pron, alaska_rule)
+
+def syllabify_batch(prons: List[List[str]], alaska_rule: bool = True) -> List[List[Syllable]]:
+    """
+    Syllabifies many pronunciations at once.
+
+    With NumPy installed, every pronunciation is encoded into one flat code
+    array and all nuclei are located in a single vectorized pass; only the
+    onset/coda resolution between nuclei runs per word. Without NumPy this
+    is equivalent to calling `syllabify` on each pronunciation.
+
+    Args:
+        prons (List[List[str]]): ARPABET pronunciations to syllabify.
+        alaska_rule (bool): Whether to apply the Alaska rule for syllabification.
+
+    Returns:
+        List[List[Syllable]]: The syllables of each pronunciation, in order.
+
+    Raises:
+        ValueError: If any pronunciation has no vowels.
+
+    Example:
+        >>> [pretty_print(s) for s in syllabify_batch([['K', 'AE1', 'T'], ['AH0', 'L', 'AE1', 'S', 'K', 'AH0']])]
+        ['K-AE1-T', 'AH0.L-AE1-S.K-AH0']
+    """
+    if np is None:
+        return [syllabify(pron, alaska_rule) for pron in prons]
+    return syllabify_batch_encoded(prons, alaska_rule)[0]
+
+def syllabify_batch_encoded(prons: List[List[str]], alaska_rule: bool = True) -> Tuple[List[List[Syllable]], 'np.ndarray', 'np.ndarray']:
+    """
+    Syllabifies many pronunciations at once and returns their encoding too.
+
+    This is `syllabify_batch` for callers that also work on the phoneme
+    codes, so that the corpus is encoded once. Requires NumPy.
+
+    Args:
+        prons (List[List[str]]): ARPABET pronunciations to syllabify.
+        alaska_rule (bool): Whether to apply the Alaska rule for syllabification.
+
+    Returns:
+        Tuple: The syllables of each pronunciation, the phoneme codes of all
+        pronunciations concatenated (int16 array, see `encode`), and the
+        exclusive end of each pronunciation in that array (int64 array).
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError: If any pronunciation has no vowels.
+
+    Example:
+        >>> syllables, codes, ends = syllabify_batch_encoded([['K', 'AE1', 'T'], ['AH0', 'L', 'AE1']])
+        >>> [PHONEMES[code] for code in codes[ends[0]:ends[1]]], ends.tolist()
+        (['AH0', 'L', 'AE1'], [3, 6])
+    """
+    if np is None:
+        raise ImportError("syllabify_batch_encoded requires NumPy.")
+
+    slax = IS_SLAX if alaska_rule else NO_SLAX
+    prons = [tuple(pron) for pron in prons]
+    ends = np.cumsum([len(pron) for pron in prons], dtype=np.int64)
+    get_id = PHONEME_ID.get
+    flat = np.fromiter(
+        (get_id(phoneme, UNKNOWN_ID) for phoneme in chain.from_iterable(prons)),
+        dtype=np.int16,
+        count=int(ends[-1]) if len(prons) else 0,
+    )
+
+    # Locate every nucleus in the corpus at once, then split them per word
+    vowel_positions = np.flatnonzero(IS_VOWEL_ARRAY[flat])
+    splits = np.searchsorted(vowel_positions, ends).tolist()
+
+    vowel_positions = vowel_positions.tolist()
+    codes = flat.tolist()
+
+    syllabified = []
+    start = first_vowel = 0
+    for pron, end, last_vowel in zip(prons, ends.tolist(), splits):
+        nuclei = [position - start for position in vowel_positions[first_vowel:last_vowel]]
+        syllabified.append(_syllabify(pron, codes[start:end], nuclei, slax))
+        start, first_vowel = end, last_vowel
+    return syllabified, flat, ends
 
 def pretty_print(syllab: List[Syllable]) -> str:
     """
     Pretty-print a syllabification.
 
     Args:
-        syllab (List[Syllable]): List of Syllable dataclasses.
+        syllab (List[Syllable]): List of Syllable tuples.
 
     Returns:
         str: A human-readable string representation of the syllabification.
     """
-    syllable_strings = []
+    # Collect every piece and separator, then join once
+    parts = []
     for syl in syllab:
-        onset = ' '.join(syl.onset)
-        nucleus = ' '.join(syl.nucleus)
-        coda = ' '.join(syl.coda)
-        syllable = '-'.join(filter(None, [onset, nucleus, coda]))
-        syllable_strings.append(syllable)
-    return '.'.join(syllable_strings)
+        parts.append('.')
+        separator = ''
+        for group in syl:
+            phonemes = ' '.join(group)
+            if phonemes:
+                parts.append(separator)
+                parts.append(phonemes)
+                separator = '-'
+    return ''.join(parts[1:])
 
 def destress(syllab: List[Syllable]) -> List[Syllable]:
     """
     Generate a syllabification with nuclear stress information removed.
 
     Args:
-        syllab (List[Syllable]): List of Syllable dataclasses.
+        syllab (List[Syllable]): List of Syllable tuples.
 
     Returns:
         List[Syllable]: Syllabification without stress markers.
     """
-    destressed_syllables = []
-    for syllable in syllab:
-        nuke = [
-            phoneme[:-1] if phoneme[-1] in {'0', '1', '2'} else phoneme
-            for phoneme in syllable.nucleus
-        ]
-        destressed_syllables.append(Syllable(syllable.onset, nuke, syllable.coda))
-    return destressed_syllables
+    destressed = DESTRESSED.get
+    # tuple.__new__ skips the NamedTuple's Python-level __new__
+    new_syllable = tuple.__new__
+    return [
+        new_syllable(Syllable, (onset, tuple([destressed(phoneme, phoneme) for phoneme in nucleus]), coda))
+        for onset, nucleus, coda in syllab
+    ]
 
 if __name__ == '__main__':
     import doctest
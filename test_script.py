@@ -3,7 +3,8 @@ import random
 import nltk
 from pathlib import Path
 import importlib.util
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import logging
 
 # Configure logging
@@ -16,6 +17,10 @@ WCM_MODULE_NAME = "wcm"
 SYLLABIFY_FILE = "syllabify.py"
 WCM_FILE = "wcm.py"
 
+# Pronunciation counts from which test_syllabify spreads work over processes
+PARALLEL_MIN_JOBS = 1000
+PARALLEL_CHUNK_SIZE = 512
+
 # List of unsyllabifiable words still found in the CMU Pronouncing Dictionary
 UNSYLLABIFIABLE_WORDS = {'fs', 'mmmm', 'shh', 'ths'}
 
@@ -80,41 +85,108 @@ def get_random_words(cmu_dict: dict, count: int = DEFAULT_WORD_COUNT) -> List[st
     return selected_words
 
 
-def test_syllabify(syllabify_module, wcm_module, word_list: List[str], cmu_dict: dict):
+def format_result(syllabify_module, wcm_module, pron: List[str]) -> str:
     """
-    Tests the syllabification and computes the Word Complexity Measure (WCM) for each word.
+    Syllabifies one pronunciation, computes its WCM and formats the report.
 
     Args:
         syllabify_module (module): The imported syllabify module.
         wcm_module (module): The imported wcm module.
-        word_list (List[str]): List of words to test syllabification.
+        pron (List[str]): A list of ARPABET phonemes.
+
+    Returns:
+        str: The report printed by test_syllabify under each word with this
+        pronunciation.
+    """
+    lines = [f"Pronunciation: {pron}"]
+    try:
+        syllables = syllabify_module.syllabify(pron)
+        syllabified_str = syllabify_module.pretty_print(syllables)
+        num_syllables = len(syllables)
+        complexity_score = wcm_module.wcm(pron)
+
+        lines.append(f"Number of Syllables: {num_syllables}")
+        lines.append(f"Syllabification: {syllabified_str}")
+        lines.append(f"Word Complexity Measure (WCM): {complexity_score}")
+    except ValueError as ve:
+        lines.append(f"Error: {ve}")
+    return "\n".join(lines)
+
+
+# Modules imported by each worker process (see _init_worker)
+_worker_modules = None
+
+
+def _init_worker(syllabify_path: Path, wcm_path: Path):
+    """
+    Imports the syllabify and wcm modules once in a worker process.
+    """
+    global _worker_modules
+    logging.getLogger().setLevel(logging.WARNING)
+    _worker_modules = (
+        import_module(SYLLABIFY_MODULE_NAME, syllabify_path),
+        import_module(WCM_MODULE_NAME, wcm_path),
+    )
+
+
+def _worker(pron: List[str]) -> str:
+    """
+    Formats the result for one pronunciation in a worker process.
+    """
+    return format_result(*_worker_modules, pron)
+
+
+def print_results(word_list: List[str], cmu_dict: dict, results: Dict[Tuple[str, ...], str]):
+    """
+    Prints formatted results in word order, one per pronunciation.
+
+    Args:
+        word_list (List[str]): The words that were tested.
         cmu_dict (dict): The CMU Pronouncing Dictionary.
+        results (Dict[Tuple[str, ...], str]): Formatted result per pronunciation.
     """
     for word in word_list:
         lower_word = word.lower()
         if lower_word in cmu_dict:
-            pronunciations = cmu_dict[lower_word]
-            for pron in pronunciations:
+            for pron in cmu_dict[lower_word]:
                 print(f"\nWord: {word}")
-                print(f"Pronunciation: {pron}")
-
-                try:
-                    syllables = syllabify_module.syllabify(pron)
-                    syllabified_str = syllabify_module.pretty_print(syllables)
-                    num_syllables = len(syllables)
-                    complexity_score = wcm_module.wcm(pron)
-
-                    print(f"Number of Syllables: {num_syllables}")
-                    print(f"Syllabification: {syllabified_str}")
-                    print(f"Word Complexity Measure (WCM): {complexity_score}")
-                except ValueError as ve:
-                    print(f"Error: {ve}")
+                print(results[tuple(pron)])
         else:
             print(f"\nWord: {word} not found in CMU dictionary.")
 
         print("-" * 40)
 
 
+def test_syllabify(syllabify_module, wcm_module, word_list: List[str], cmu_dict: dict):
+    """
+    Tests the syllabification and computes the Word Complexity Measure (WCM) for each word.
+
+    Each distinct pronunciation is processed once, however many words share
+    it. Large runs are spread over a process pool; results are still printed
+    in word order by the main process.
+
+    Args:
+        syllabify_module (module): The imported syllabify module.
+        wcm_module (module): The imported wcm module.
+        word_list (List[str]): List of words to test syllabification.
+        cmu_dict (dict): The CMU Pronouncing Dictionary.
+    """
+    # Distinct pronunciations, keyed by tuple so homographs share one result
+    prons: Dict[Tuple[str, ...], List[str]] = {}
+    for word in word_list:
+        for pron in cmu_dict.get(word.lower(), ()):
+            prons.setdefault(tuple(pron), pron)
+
+    if len(prons) < PARALLEL_MIN_JOBS:
+        formatted = [format_result(syllabify_module, wcm_module, pron) for pron in prons.values()]
+    else:
+        initargs = (Path(syllabify_module.__file__), Path(wcm_module.__file__))
+        with ProcessPoolExecutor(initializer=_init_worker, initargs=initargs) as executor:
+            formatted = list(executor.map(_worker, prons.values(), chunksize=PARALLEL_CHUNK_SIZE))
+
+    print_results(word_list, cmu_dict, dict(zip(prons, formatted)))
+
+
 def prompt_user_choice() -> Optional[str]:
     """
     Presents an interactive menu to the user and captures their choice.
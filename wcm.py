@@ -1,15 +1,65 @@
-from syllabify import syllabify
+import sys
+from functools import lru_cache
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from syllabify import PHONEMES, Syllable, syllabify_batch_encoded, syllabify_view
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; wcm_batch falls back to wcm
+    np = None
 
 # Constants
-DORSALS = {'K', 'G', 'NG'}
-LIQUIDS = {'L', 'R'}
-VOICED_AF = {'V', 'DH', 'Z', 'ZH'}
-AF = {'F', 'TH', 'S', 'SH', 'CH'} | VOICED_AF
+# Symbols are interned so lookups with interned phonemes (as syllabify's
+# tables are) match by identity
+DORSALS = frozenset(map(sys.intern, ('K', 'G', 'NG')))
+LIQUIDS = frozenset(map(sys.intern, ('L', 'R')))
+VOICED_AF = frozenset(map(sys.intern, ('V', 'DH', 'Z', 'ZH')))
+AF = frozenset(map(sys.intern, ('F', 'TH', 'S', 'SH', 'CH'))) | VOICED_AF
+
+# Sound-class points per consonant: one for each class it belongs to
+PHONEME_SCORE = {
+    ph: (ph in DORSALS) + (ph in LIQUIDS) + (ph in AF) + (ph in VOICED_AF)
+    for ph in DORSALS | LIQUIDS | AF
+}
+
+# PHONEME_SCORE indexed by syllabify phoneme code; vowels and unknown
+# symbols score 0
+SCORE_LUT = (
+    np.array([PHONEME_SCORE.get(ph, 0) for ph in PHONEMES] + [0], dtype=np.uint8)
+    if np is not None else None
+)
+
+class WordFeatures(NamedTuple):
+    """Syllable-level features of a word, shared by phonological metrics."""
+    syllables: int
+    onset_clusters: int
+    coda_clusters: int
+    final_coda: bool
+    primary_stress: int  # bit i is set when syllable i has primary stress
+    sound_class_score: int
 
-def wcm(phonemes):
+    @property
+    def nonfirst_stress(self) -> bool:
+        """Whether any syllable but the first has primary stress."""
+        return (self.primary_stress >> 1) != 0
+
+    @property
+    def structure_score(self) -> int:
+        """WCM points for word patterns and syllable structures."""
+        return (
+            (self.syllables > 2) + self.nonfirst_stress +
+            self.final_coda + self.onset_clusters + self.coda_clusters
+        )
+
+def wcm(phonemes: List[str]) -> int:
     """
     Calculate the Word Complexity Measure (WCM) for a given word based on its phonemic structure.
 
+    The score is computed from `syllable_features`, which is memoized on
+    the full phoneme sequence, stress digits included, so repeated words in
+    a corpus are syllabified and scanned once.
+
     Args:
         phonemes (list): A list of ARPABET phonemes representing a word.
 
@@ -21,54 +71,102 @@ def wcm(phonemes):
         application to developmental phonology and disorders. Clinical
         Linguistics and Phonetics 24(4-5): 271-282.
     """
-    syllables = syllabify(phonemes)
-    score = 0
-
-    # Word Patterns
-    # (1) More than two syllables
-    if len(syllables) > 2:
-        score += 1
-
-    # (2) Stress on any syllable but the first (marked as FIXME)
-    # Assuming syllabify returns a Syllable dataclass with a nucleus containing stress
-    if len(syllables) > 1:
-        # Check if any syllable other than the first has primary stress ('1')
-        if any('1' in syllable.nucleus[0] for syllable in syllables[1:]):
-            score += 1
-
-    # Syllable Structures
-    # (1) Word-final consonant
-    if syllables[-1].coda:
-        score += 1
-
-    # (2) Syllable clusters
-    for syllable in syllables:
-        # Onset clusters (two or more consonants)
-        if len(syllable.onset) > 1:
-            score += 1
-        # Coda clusters (two or more consonants)
-        if len(syllable.coda) > 1:
-            score += 1
-
-    # Sound Classes
-    for syllable in syllables:
-        # Combine onset and coda phonemes
-        consonants = syllable.onset + syllable.coda
-
-        # (1) Velar consonants
-        velars = sum(ph in DORSALS for ph in consonants)
-        score += velars
-
-        # (2) Liquids
-        liquids = sum(ph in LIQUIDS for ph in consonants)
-        score += liquids
-
-        # (3) Fricatives and affricates
-        fricatives_affricates = sum(ph in AF for ph in consonants)
-        score += fricatives_affricates
-
-        # (4) Voiced fricatives and affricates
-        voiced_fricatives_affricates = sum(ph in VOICED_AF for ph in consonants)
-        score += voiced_fricatives_affricates
-
-    return score
\ No newline at end of file
+    features = _features_cached(tuple(phonemes))
+    return features.structure_score + features.sound_class_score
+
+def syllable_features(phonemes: List[str]) -> WordFeatures:
+    """
+    Syllabify a word once and collect the features WCM-style metrics need.
+
+    Args:
+        phonemes (list): A list of ARPABET phonemes representing a word.
+
+    Returns:
+        WordFeatures: Syllable count, cluster counts, word-final consonant,
+        primary-stress bitmap and sound-class points of the word.
+
+    Example:
+        >>> syllable_features(['K', 'R', 'IH1', 'S', 'K', 'R', 'AO2', 'S', 'IH0', 'NG'])
+        WordFeatures(syllables=3, onset_clusters=2, coda_clusters=0, final_coda=True, primary_stress=1, sound_class_score=7)
+    """
+    return _features_cached(tuple(phonemes))
+
+@lru_cache(maxsize=131072)
+def _features_cached(phonemes: Tuple[str, ...]) -> WordFeatures:
+    """Compute the features of a phoneme tuple; see `syllable_features`."""
+    return _features(syllabify_view(phonemes), PHONEME_SCORE.get)
+
+def _features(syllables: Sequence[Syllable], score_of: Optional[Callable[[str, int], int]]) -> WordFeatures:
+    """
+    Collect the features of a syllabified word in one pass over its syllables.
+
+    `score_of` looks up a consonant's sound-class points; with None the
+    sound classes are skipped and scored as 0 (wcm_batch scores them
+    separately).
+    """
+    onset_clusters = coda_clusters = sound_class_score = primary_stress = 0
+
+    # Stress, syllable clusters and sound classes, in one pass over the
+    # syllables. Sound classes: (1) velars, (2) liquids, (3) fricatives and
+    # affricates and (4) voiced fricatives and affricates each add a point
+    # per consonant; PHONEME_SCORE holds each consonant's total
+    for i, (onset, nucleus, coda) in enumerate(syllables):
+        # Primary stress; the stress digit is always the last character of
+        # an ARPABET vowel. Monosyllables need bit 0 too, so they are not
+        # special-cased
+        primary_stress |= (nucleus[0][-1] == '1') << i
+        # Onset and coda clusters (two or more consonants)
+        onset_clusters += len(onset) > 1
+        coda_clusters += len(coda) > 1
+        if score_of is not None:
+            for ph in onset:
+                sound_class_score += score_of(ph, 0)
+            for ph in coda:
+                sound_class_score += score_of(ph, 0)
+
+    return WordFeatures(
+        len(syllables),  # Word Patterns (1): more than two syllables
+        onset_clusters,
+        coda_clusters,
+        bool(syllables[-1].coda),  # Syllable Structures (1): word-final consonant
+        primary_stress,  # Word Patterns (2): stress on any syllable but the first
+        sound_class_score,
+    )
+
+def wcm_batch(words: List[List[str]]) -> List[int]:
+    """
+    Calculate the WCM for many words at once.
+
+    With NumPy installed, the words are syllabified with `syllabify_batch`
+    and the sound-class points of the whole corpus are looked up in one
+    pass over its phoneme codes (vowels score 0, so every phoneme of a word
+    can be summed), then reduced per word with a cumulative sum. Only the
+    word-pattern and syllable-structure checks run per word.
+
+    Args:
+        words (List[List[str]]): ARPABET pronunciations to score.
+
+    Returns:
+        List[int]: The complexity score of each word, in order.
+
+    Raises:
+        ValueError: If any pronunciation has no vowels.
+
+    Example:
+        >>> wcm_batch([['K', 'AE1', 'T'], ['K', 'R', 'IH1', 'S', 'K', 'R', 'AO2', 'S', 'IH0', 'NG']])
+        [2, 11]
+    """
+    if np is None:
+        return [wcm(phonemes) for phonemes in words]
+
+    syllabified, codes, ends = syllabify_batch_encoded(words)
+    structure = np.fromiter(
+        (_features(syllables, None).structure_score for syllables in syllabified),
+        dtype=np.int64,
+        count=len(syllabified),
+    )
+
+    # Per-word sums as differences of a running total; unlike reduceat this
+    # is also right for words without scored consonants
+    totals = np.concatenate(([0], np.cumsum(SCORE_LUT[codes], dtype=np.int64)))
+    return (structure + np.diff(totals[ends], prepend=0)).tolist()